@@ -2,7 +2,6 @@ import tkinter as tk
 from tkinter import simpledialog, Toplevel, ttk
 from datetime import datetime, timedelta, time as dtime
 import time, sqlite3
-from collections import defaultdict
 
 # Matplotlib embed (optional)
 try:
@@ -66,6 +65,24 @@ ICON_FALLBACK = {
     "Projects": "PROJ",
 }
 
+# ---------- SQL (hot paths; reused via sqlite3's statement cache) ----------
+SQL_INSERT_ACTIVITY = "INSERT OR IGNORE INTO activities(name) VALUES(?);"
+SQL_GET_ACT_ID = "SELECT id FROM activities WHERE name = ?;"
+SQL_INSERT_SESSION = "INSERT INTO sessions(activity_id, start_ts, end_ts, duration_sec) VALUES (?,?,?,?);"
+SQL_UPDATE_SESSION = "UPDATE sessions SET end_ts = ?, duration_sec = ? WHERE id = ?;"
+SQL_UPSERT_DAILY = """
+    INSERT INTO daily_totals(date, activity_id, seconds)
+    VALUES(?,?,?)
+    ON CONFLICT(date, activity_id) DO UPDATE SET
+      seconds = seconds + excluded.seconds;
+"""
+
+# Overlay canvas text items, bottom to top (shadows under foregrounds)
+OVERLAY_ITEM_ROLES = ("icon_shadow", "time_shadow", "icon", "time", "daily_shadow", "daily")
+
+# Dashboard: sessions are listed most recent first, one page at a time
+DASHBOARD_PAGE_SIZE = 200
+
 NORMAL_SIZE = 36
 WASTE_SIZE  = 96
 
@@ -82,27 +99,60 @@ class StopwatchApp:
         self.root.title("Activity Logger (SQLite)")
 
         # --- DB setup ---
-        self.conn = sqlite3.connect(DB_FILE)
+        self.conn = sqlite3.connect(DB_FILE, cached_statements=256)
         self.conn.execute("PRAGMA foreign_keys = ON;")
+        # WAL + NORMAL: commits append to the log instead of fsyncing the main db
+        self.conn.execute("PRAGMA journal_mode = WAL;")
+        self.conn.execute("PRAGMA synchronous = NORMAL;")
+        self.conn.execute("PRAGMA temp_store = MEMORY;")
+        self.conn.execute("PRAGMA cache_size = -8000;")
         self.cur = self.conn.cursor()
         self._init_db()
         self._seed_default_activities()
+        # name -> id, so switching activities doesn't hit the DB
+        self._activity_id_by_name = dict(self.cur.execute("SELECT name, id FROM activities;").fetchall())
+        # id -> stored (canonical) name, to keep today's totals cache current without a query
+        self._activity_name_by_id = {act_id: name for name, act_id in self._activity_id_by_name.items()}
 
         # --- State ---
         self.running = False
-        self.start_time = None              # epoch seconds
+        self.start_time = None              # epoch seconds (wall clock, for persisting)
+        self.start_monotonic = None         # time.monotonic() at start (for elapsed time)
         self.start_timestamp = None         # ISO string
         self.current_activity_id = None
         self.current_activity_name = None
         self.current_session_id = None      # <-- NEW: live session row id
+        self._cur_color = "gray"            # overlay shadow color for the current activity
+        self._cur_icon = ""                 # overlay icon for the current activity
 
         # Autosave / rollover
         self._autosave_interval_ms = 60_000  # 1 minute
         self._last_autosave_dt = datetime.now().replace(microsecond=0)
 
+        # In-memory copy of today's daily_totals (name -> seconds)
+        self._today_totals_cache = {}
+        self._today_totals_date = None       # 'YYYY-MM-DD' the cache belongs to
+
+        # daily_totals deltas not yet written: (date_str, activity_id) -> seconds
+        self._pending_daily_delta = {}
+        self._autosaves_per_flush = 5        # flush every 5 autosaves (~5 min)
+        self._autosaves_since_flush = 0
+
+        # Redraw loops: clock label is fast, overlay + daily totals line are slow
+        self._clock_interval_ms = 10
+        self._overlay_interval_ms = 250
+        self._day_check_interval_sec = 30
+        self._last_day_check_sec = 0.0       # epoch seconds of the last date-flip check
+        self._daily_line_cache = None        # formatted daily totals line (None = not built)
+        self._icons_by_name = {n: self._icon_for_name(n) for n in DEFAULT_ACTIVITIES}
+
         # --- Transparent overlay config ---
         self.overlay = None
         self.overlay_canvas = None
+        self._overlay_items = {}            # role -> canvas text item id
+        self._last_overlay_layout = None    # (icon, daily line, size, color, time length) drawn last time
+        self._last_overlay_text = None      # time text drawn last time
+        self._last_canvas_size = None       # (w, h) applied last time
         self.TRANSPARENT_COLOR = "#ff00ff"
         self._overlay_supports_color = True
         self.show_daily_totals = False  # toggle for second line
@@ -112,10 +162,12 @@ class StopwatchApp:
         self.overlay_font_tuple = ("Consolas", self.overlay_font_size, "bold")
         self.overlay_font_metrics = tkfont.Font(family="Consolas", size=self.overlay_font_size, weight="bold")
 
-        # Icon (smaller) + daily totals (emoji-capable, smaller)
+        # Icon (smaller) + daily totals (emoji-capable, smaller); created once, resized via configure()
         self.overlay_icon_font_metrics = self._make_icon_font(self._icon_size_for(self.overlay_font_size))
         self.overlay_sub_font_metrics  = self._make_icon_font(self._sub_size_for(self.overlay_font_size))
 
+        self._cache_overlay_metrics()
+
         # --- Main clock (non-transparent) ---
         self.clock_label = tk.Label(root, text="00:00:00.00", font=("Consolas", 40))
         self.clock_label.pack(pady=(8,4))
@@ -161,8 +213,9 @@ class StopwatchApp:
         # Cleanup on close
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
-        # Kick off clock + autosave loops
-        self._update_clock()
+        # Kick off clock, overlay + autosave loops
+        self._tick_label()
+        self._tick_overlay()
         self._schedule_autosave()
 
     # -------------------- DB --------------------
@@ -192,13 +245,14 @@ class StopwatchApp:
                 FOREIGN KEY(activity_id) REFERENCES activities(id) ON DELETE CASCADE
             );
         """)
+        # Dashboard: per-activity totals and most-recent-first session listing
+        self.cur.execute("CREATE INDEX IF NOT EXISTS idx_sessions_activity ON sessions(activity_id, start_ts DESC);")
+        self.cur.execute("CREATE INDEX IF NOT EXISTS idx_sessions_start ON sessions(start_ts);")
         self.conn.commit()
 
     def _seed_default_activities(self):
-        for name in DEFAULT_ACTIVITIES:
-            self.cur.execute("INSERT OR IGNORE INTO activities(name) VALUES(?);", (name,))
-        self.cur.execute("INSERT OR IGNORE INTO activities(name) VALUES('Custom');")
-        self.conn.commit()
+        with self.conn:
+            self.cur.executemany(SQL_INSERT_ACTIVITY, [(n,) for n in (*DEFAULT_ACTIVITIES, "Custom")])
 
     def _load_activities(self):
         rows = self.cur.execute("SELECT name FROM activities ORDER BY name;").fetchall()
@@ -207,10 +261,14 @@ class StopwatchApp:
         return names
 
     def _get_or_create_activity(self, name):
-        self.cur.execute("INSERT OR IGNORE INTO activities(name) VALUES(?);", (name,))
-        self.conn.commit()
-        row = self.cur.execute("SELECT id FROM activities WHERE name = ?;", (name,)).fetchone()
-        return row[0]
+        act_id = self._activity_id_by_name.get(name)
+        if act_id is None:
+            # novel name (or a different spelling of a NOCASE match): ask the DB once
+            self.cur.execute(SQL_INSERT_ACTIVITY, (name,))
+            act_id = self.cur.execute(SQL_GET_ACT_ID, (name,)).fetchone()[0]
+            self._activity_id_by_name[name] = act_id
+            self._activity_name_by_id.setdefault(act_id, name)
+        return act_id
 
     # -------------------- UI helpers --------------------
     def _build_activity_radios(self):
@@ -233,42 +291,46 @@ class StopwatchApp:
         """Create a sessions row for the current activity and remember its id."""
         start_ts = start_dt.strftime("%Y-%m-%d %H:%M:%S")
         # initialize end_ts = start_ts and duration_sec = 0
-        self.cur.execute(
-            "INSERT INTO sessions(activity_id, start_ts, end_ts, duration_sec) VALUES (?,?,?,?);",
-            (self.current_activity_id, start_ts, start_ts, 0.0)
-        )
-        self.conn.commit()
+        self.cur.execute(SQL_INSERT_SESSION, (self.current_activity_id, start_ts, start_ts, 0.0))
         self.current_session_id = self.cur.lastrowid
 
-    def _update_current_session_row(self, end_dt: datetime):
-        """Update end_ts + duration_sec of the current live session row."""
-        if not self.running or self.current_session_id is None or self.start_time is None:
+    def _update_current_session_row(self, end_dt: datetime, end_monotonic=None):
+        """Update end_ts + duration_sec of the current live session row.
+           Duration is measured on the monotonic clock (end_monotonic defaults to now).
+        """
+        if not self.running or self.current_session_id is None or self.start_monotonic is None:
             return
-        duration = max(0.0, time.mktime(end_dt.timetuple()) - self.start_time)
+        if end_monotonic is None:
+            end_monotonic = time.monotonic()
+        duration = max(0.0, end_monotonic - self.start_monotonic)
         self.cur.execute(
-            "UPDATE sessions SET end_ts = ?, duration_sec = ? WHERE id = ?;",
+            SQL_UPDATE_SESSION,
             (end_dt.strftime("%Y-%m-%d %H:%M:%S"), round(duration, 2), self.current_session_id)
         )
-        self.conn.commit()
 
-    def _finalize_current_session_row(self, end_dt: datetime):
+    def _finalize_current_session_row(self, end_dt: datetime, end_monotonic=None):
         """Finalize the current session (update row one last time, then clear id)."""
-        self._update_current_session_row(end_dt)
+        self._update_current_session_row(end_dt, end_monotonic)
         self.current_session_id = None
 
     def _start_activity(self, name):
         """Stop & log previous session (update row), then start a new session for 'name'."""
-        self._save_previous_activity_if_running()
-        self.current_activity_name = name
-        self.current_activity_id = self._get_or_create_activity(name)
-        self.running = True
-        now = datetime.now()
-        self.start_time = time.mktime(now.timetuple())
-        self.start_timestamp = now.strftime("%Y-%m-%d %H:%M:%S")
-        self._last_autosave_dt = now.replace(microsecond=0)
-
-        # create a live session row immediately
-        self._create_new_session_row(now)
+        with self.conn:
+            self._save_previous_activity_if_running()
+            self._flush_daily_totals()
+            self.current_activity_name = name
+            self._cur_color = COLOR_MAP.get(name, "gray")
+            self._cur_icon = ICON_MAP.get(name, ICON_FALLBACK.get(name, ""))
+            self.current_activity_id = self._get_or_create_activity(name)
+            self.running = True
+            self.start_time = time.time()
+            self.start_monotonic = time.monotonic()
+            now = datetime.fromtimestamp(self.start_time)
+            self.start_timestamp = now.strftime("%Y-%m-%d %H:%M:%S")
+            self._last_autosave_dt = now.replace(microsecond=0)
+
+            # create a live session row immediately
+            self._create_new_session_row(now)
 
         # Overlay policy
         if name == "Waste":
@@ -287,6 +349,7 @@ class StopwatchApp:
             self._finalize_current_session_row(end_dt)
             self.running = False
             self.start_time = None
+            self.start_monotonic = None
             self.start_timestamp = None
 
     # Midnight rollover support
@@ -304,15 +367,24 @@ class StopwatchApp:
 
         midnight = datetime.combine(reference_dt.date() + timedelta(days=1), dtime.min)
         secs_to_midnight = (midnight - reference_dt).total_seconds()
+        # Monotonic instant that corresponds to midnight
+        midnight_monotonic = time.monotonic() - max(0.0, (datetime.now() - midnight).total_seconds())
         if secs_to_midnight > 0:
             # Add to yesterday totals
             self._add_to_daily_total(reference_dt.date(), self.current_activity_id, secs_to_midnight)
             # Finalize current session row exactly at midnight
-            self._finalize_current_session_row(midnight)
+            self._finalize_current_session_row(midnight, midnight_monotonic)
+
+        # Yesterday is closed: write its pending totals now
+        self._flush_daily_totals()
+
+        # New day -> today's totals cache is stale
+        self._today_totals_date = None
 
         # Start a fresh session from midnight with the same activity
         self.running = True
-        self.start_time = time.mktime(midnight.timetuple())
+        self.start_time = midnight.timestamp()
+        self.start_monotonic = midnight_monotonic
         self.start_timestamp = midnight.strftime("%Y-%m-%d %H:%M:%S")
         self._create_new_session_row(midnight)
 
@@ -330,7 +402,7 @@ class StopwatchApp:
 
     def _do_autosave(self):
         """Persist progress at most once per minute.
-           - Updates daily_totals for the running activity.
+           - Accumulates daily_totals for the running activity (flushed every 5 autosaves).
            - Updates the live 'sessions' row's end_ts and duration_sec.
            - Handles midnight rollover.
         """
@@ -339,42 +411,68 @@ class StopwatchApp:
 
         if not self.running or self.current_activity_id is None:
             self._last_autosave_dt = now_dt
+            self._rebuild_daily_line()  # picks up a day change while stopped
             return
 
-        # Handle day change
-        ref = self._rollover_midnight_if_needed(ref, now_dt)
+        # One transaction (one fsync) for everything written this tick
+        with self.conn:
+            # Handle day change
+            ref = self._rollover_midnight_if_needed(ref, now_dt)
 
-        # Accumulate elapsed seconds since last autosave
-        delta_sec = (now_dt - ref).total_seconds()
-        if delta_sec > 0:
-            self._add_to_daily_total(now_dt.date(), self.current_activity_id, delta_sec)
-            self._last_autosave_dt = now_dt
+            # Accumulate elapsed seconds since last autosave
+            delta_sec = (now_dt - ref).total_seconds()
+            if delta_sec > 0:
+                self._add_to_daily_total(now_dt.date(), self.current_activity_id, delta_sec)
+                self._last_autosave_dt = now_dt
+
+            # Always update the current session row's end/duration
+            self._update_current_session_row(now_dt)
 
-        # Always update the current session row's end/duration
-        self._update_current_session_row(now_dt)
+            self._autosaves_since_flush += 1
+            if self._autosaves_since_flush >= self._autosaves_per_flush:
+                self._flush_daily_totals()
 
         # Re-render overlay (daily totals line)
+        self._rebuild_daily_line()
         self._render_overlay_text(self._current_time_text())
 
     def _add_to_daily_total(self, date_obj, activity_id, seconds):
+        """Queue seconds for daily_totals; written by _flush_daily_totals."""
         date_str = date_obj.strftime("%Y-%m-%d")
-        self.cur.execute("""
-            INSERT INTO daily_totals(date, activity_id, seconds)
-            VALUES(?,?,?)
-            ON CONFLICT(date, activity_id) DO UPDATE SET
-              seconds = seconds + excluded.seconds;
-        """, (date_str, activity_id, float(seconds)))
-        self.conn.commit()
+        key = (date_str, activity_id)
+        self._pending_daily_delta[key] = self._pending_daily_delta.get(key, 0.0) + float(seconds)
+        # Keep today's cache in step (it already reflects pending deltas)
+        if date_str == self._today_totals_date:
+            name = self._activity_name_by_id[activity_id]
+            self._today_totals_cache[name] = self._today_totals_cache.get(name, 0.0) + float(seconds)
+
+    def _flush_daily_totals(self):
+        """Write all pending daily_totals deltas in one executemany (caller owns the transaction)."""
+        if self._pending_daily_delta:
+            self.cur.executemany(
+                SQL_UPSERT_DAILY,
+                [(date_str, activity_id, secs) for (date_str, activity_id), secs in self._pending_daily_delta.items()]
+            )
+            self._pending_daily_delta.clear()
+        self._autosaves_since_flush = 0
 
     def _get_today_totals(self):
+        """Today's totals per activity name; loaded from SQLite once per day."""
         today = datetime.now().strftime("%Y-%m-%d")
-        rows = self.cur.execute("""
-            SELECT a.name, dt.seconds
-            FROM daily_totals dt
-            JOIN activities a ON a.id = dt.activity_id
-            WHERE dt.date = ?
-        """, (today,)).fetchall()
-        return {name: float(sec) for name, sec in rows}
+        if today != self._today_totals_date:
+            # The reload reads what is on disk, so push pending deltas first
+            if self._pending_daily_delta:
+                with self.conn:
+                    self._flush_daily_totals()
+            rows = self.cur.execute("""
+                SELECT a.name, dt.seconds
+                FROM daily_totals dt
+                JOIN activities a ON a.id = dt.activity_id
+                WHERE dt.date = ?
+            """, (today,)).fetchall()
+            self._today_totals_cache = {name: float(sec) for name, sec in rows}
+            self._today_totals_date = today
+        return self._today_totals_cache
 
     # -------------------- Switch / Start / Stop --------------------
     def _switch_activity(self):
@@ -384,7 +482,8 @@ class StopwatchApp:
             self.activity_var.set(prev)
             custom = simpledialog.askstring("Custom Activity", "Enter activity name:")
             if custom:
-                self._get_or_create_activity(custom)
+                with self.conn:
+                    self._get_or_create_activity(custom)
                 self._build_activity_radios()
                 self.activity_var.set(custom)
                 self._start_activity(custom)
@@ -400,6 +499,8 @@ class StopwatchApp:
         # Final autosave increment + finalize live session row
         self._do_autosave()
         self._save_previous_activity_if_running()
+        self._flush_daily_totals()
+        self.conn.commit()
 
     # -------------------- Overlay helpers --------------------
     def toggle_overlay(self):
@@ -415,6 +516,7 @@ class StopwatchApp:
 
     def toggle_daily_totals(self):
         self.show_daily_totals = not self.show_daily_totals
+        self._rebuild_daily_line()
         self._render_overlay_text(self._current_time_text())
 
     def _ensure_overlay_visible(self):
@@ -436,11 +538,22 @@ class StopwatchApp:
         self.overlay_size_var.set(self.overlay_font_size)
         self.overlay_font_tuple = ("Consolas", self.overlay_font_size, "bold")
         self.overlay_font_metrics.configure(size=self.overlay_font_size)
-        # resize subordinate fonts (use emoji-capable font for icons & daily row)
-        self.overlay_icon_font_metrics = self._make_icon_font(self._icon_size_for(self.overlay_font_size))
-        self.overlay_sub_font_metrics  = self._make_icon_font(self._sub_size_for(self.overlay_font_size))
+        # resize subordinate fonts in place (no new Font objects per slider event)
+        self.overlay_icon_font_metrics.configure(size=self._icon_size_for(self.overlay_font_size))
+        self.overlay_sub_font_metrics.configure(size=self._sub_size_for(self.overlay_font_size))
+        self._cache_overlay_metrics()
         self._render_overlay_text(self._current_time_text())
 
+    def _cache_overlay_metrics(self):
+        """Measure the fixed parts of the overlay once per font size, not per frame."""
+        self._char_w = self.overlay_font_metrics.measure("0")  # Consolas: every char this wide
+        self._time_h = self.overlay_font_metrics.metrics("linespace")
+        self._icon_w_cache = {
+            ICON_MAP[n]: self.overlay_icon_font_metrics.measure(ICON_MAP[n]) for n in DEFAULT_ACTIVITIES
+        }
+        self._icon_h = self.overlay_icon_font_metrics.metrics("linespace")
+        self._sub_h = self.overlay_sub_font_metrics.metrics("linespace")
+
     def _on_overlay_size_change(self, value):
         self._apply_overlay_size(int(float(value)))
 
@@ -465,6 +578,10 @@ class StopwatchApp:
             self.overlay, bg=self.TRANSPARENT_COLOR, highlightthickness=0, bd=0
         )
         self.overlay_canvas.pack()
+        self._create_overlay_items()
+        self._last_overlay_layout = None
+        self._last_overlay_text = None
+        self._last_canvas_size = None
 
         self._position_overlay_default()
         self._render_overlay_text(self._current_time_text())
@@ -476,6 +593,15 @@ class StopwatchApp:
         # Double-click toggle (blocked during Waste)
         self.overlay_canvas.bind("<Double-Button-1>", lambda e: self.toggle_overlay())
 
+    def _create_overlay_items(self):
+        """Create the overlay's text items once; renders only reconfigure them.
+           Stacking order = creation order: shadows below foregrounds.
+        """
+        self._overlay_items = {
+            role: self.overlay_canvas.create_text(0, 0, text="", anchor="nw")
+            for role in OVERLAY_ITEM_ROLES
+        }
+
     def _start_move(self, event):
         self._drag_data["x"] = event.x
         self._drag_data["y"] = event.y
@@ -485,14 +611,6 @@ class StopwatchApp:
         y = event.y_root - self._drag_data["y"]
         self.overlay.geometry(f"+{x}+{y}")
 
-    def _activity_shadow_color(self):
-        name = self.current_activity_name or self.activity_var.get() or ""
-        return COLOR_MAP.get(name, "gray")
-
-    def _activity_icon(self):
-        name = self.current_activity_name or self.activity_var.get() or ""
-        return ICON_MAP.get(name, ICON_FALLBACK.get(name, ""))
-
     def _icon_for_name(self, name: str) -> str:
         return ICON_MAP.get(name, ICON_FALLBACK.get(name, name))
 
@@ -519,86 +637,89 @@ class StopwatchApp:
         gap = 8           # space between icon and time
         line_gap = 2      # gap between main line and daily totals line
 
-        icon_text = self._activity_icon()
+        # resolved once per activity switch in _start_activity
+        icon_text = self._cur_icon
+        color = self._cur_color
+
+        # --- Daily totals string (line 2) — prebuilt, see _rebuild_daily_line ---
+        daily_line = (self._daily_line_cache or "") if self.show_daily_totals else ""
+
+        # Same layout -> at most the digits changed: retext the two time items, nothing else
+        layout_key = (icon_text, daily_line, self.overlay_font_size, color, len(text))
+        if layout_key == self._last_overlay_layout:
+            if text != self._last_overlay_text:
+                self.overlay_canvas.itemconfigure(self._overlay_items["time_shadow"], text=text)
+                self.overlay_canvas.itemconfigure(self._overlay_items["time"], text=text)
+                self._last_overlay_text = text
+            return
+        self._last_overlay_layout = layout_key
+        self._last_overlay_text = text
 
         # --- Fonts ---
         icon_font = self.overlay_icon_font_metrics
         time_font = self.overlay_font_metrics
         sub_font  = self.overlay_sub_font_metrics
 
-        # --- Measurements (line 1) ---
-        icon_w = icon_font.measure(icon_text) if icon_text else 0
-        icon_h = icon_font.metrics("linespace") if icon_text else 0
-        time_w = time_font.measure(text)
-        time_h = time_font.metrics("linespace")
+        # --- Measurements (line 1) — precomputed in _cache_overlay_metrics ---
+        icon_w = 0
+        if icon_text:
+            icon_w = self._icon_w_cache.get(icon_text)
+            if icon_w is None:
+                icon_w = icon_font.measure(icon_text)
+        icon_h = self._icon_h if icon_text else 0
+        time_w = self._char_w * len(text)
+        time_h = self._time_h
         line1_w = icon_w + (gap if icon_text else 0) + time_w
         line1_h = max(icon_h, time_h)
 
-        # --- Daily totals string (line 2) — USE ICONS ---
-        daily_line = ""
-        if self.show_daily_totals:
-            totals = self._get_today_totals()
-            entries = []
-            for name in DEFAULT_ACTIVITIES:
-                secs = int(totals.get(name, 0))
-                entries.append(f"{self._icon_for_name(name)} {self._fmt_short(secs)}")
-            daily_line = "  •  ".join(entries)
-
         line2_w = sub_font.measure(daily_line) if daily_line else 0
-        line2_h = sub_font.metrics("linespace") if daily_line else 0
+        line2_h = self._sub_h if daily_line else 0
 
-        # --- Canvas size ---
+        # --- Canvas size (only touch it when it changes) ---
         total_w = max(line1_w, line2_w) + 2*pad + offset
         total_h = line1_h + (line_gap + line2_h if daily_line else 0) + 2*pad + offset
-        self.overlay_canvas.config(width=total_w, height=total_h)
-        self.overlay_canvas.delete("all")
+        if (total_w, total_h) != self._last_canvas_size:
+            self.overlay_canvas.config(width=total_w, height=total_h)
+            self._last_canvas_size = (total_w, total_h)
 
         # --- Baselines ---
         x0 = pad
         y0 = pad
-
-        # ---- Draw line 1 (shadow) ----
-        if icon_text:
-            self.overlay_canvas.create_text(
-                x0 + offset, y0 + offset, text=icon_text,
-                font=(icon_font.cget("family"), icon_font.cget("size"), "bold"),
-                fill=self._activity_shadow_color(), anchor="nw"
-            )
-        self.overlay_canvas.create_text(
-            x0 + (icon_w + gap if icon_text else 0) + offset, y0 + offset, text=text,
-            font=(time_font.cget("family"), time_font.cget("size"), "bold"),
-            fill=self._activity_shadow_color(), anchor="nw"
+        time_x = x0 + (icon_w + gap if icon_text else 0)
+        y2 = y0 + line1_h + line_gap
+
+        icon_spec = (icon_font.cget("family"), icon_font.cget("size"), "bold")
+        time_spec = (time_font.cget("family"), time_font.cget("size"), "bold")
+        sub_spec  = (sub_font.cget("family"), sub_font.cget("size"), "bold")
+
+        # role -> (x, y, text, font, fill), in OVERLAY_ITEM_ROLES order
+        layout = (
+            ("icon_shadow", x0 + offset, y0 + offset, icon_text, icon_spec, color),
+            ("time_shadow", time_x + offset, y0 + offset, text, time_spec, color),
+            ("icon", x0, y0, icon_text, icon_spec, "black"),
+            ("time", time_x, y0, text, time_spec, "black"),
+            ("daily_shadow", x0 + offset, y2 + offset, daily_line, sub_spec, color),
+            ("daily", x0, y2, daily_line, sub_spec, "black"),
         )
 
-        # ---- Draw line 1 (foreground) ----
-        if icon_text:
-            self.overlay_canvas.create_text(
-                x0, y0, text=icon_text,
-                font=(icon_font.cget("family"), icon_font.cget("size"), "bold"),
-                fill="black", anchor="nw"
-            )
-        self.overlay_canvas.create_text(
-            x0 + (icon_w + gap if icon_text else 0), y0, text=text,
-            font=(time_font.cget("family"), time_font.cget("size"), "bold"),
-            fill="black", anchor="nw"
+        # Reconfigure the persistent items (see _create_overlay_items); nothing is allocated here
+        items = self._overlay_items
+        for role, x, y, item_text, font, fill in layout:
+            item_id = items[role]
+            self.overlay_canvas.coords(item_id, x, y)
+            self.overlay_canvas.itemconfigure(item_id, text=item_text, font=font, fill=fill)
+
+    def _rebuild_daily_line(self):
+        """Format today's totals (icons + compact time) once; the overlay just reads it."""
+        if not self.show_daily_totals:
+            self._daily_line_cache = None
+            return
+        totals = self._get_today_totals()
+        self._daily_line_cache = "  •  ".join(
+            f"{self._icons_by_name[name]} {self._fmt_short(int(totals.get(name, 0)))}"
+            for name in DEFAULT_ACTIVITIES
         )
 
-        # ---- Draw line 2 (daily totals) ----
-        if daily_line:
-            y2 = y0 + line1_h + line_gap
-            # shadow
-            self.overlay_canvas.create_text(
-                x0 + offset, y2 + offset, text=daily_line,
-                font=(sub_font.cget("family"), sub_font.cget("size"), "bold"),
-                fill=self._activity_shadow_color(), anchor="nw"
-            )
-            # foreground
-            self.overlay_canvas.create_text(
-                x0, y2, text=daily_line,
-                font=(sub_font.cget("family"), sub_font.cget("size"), "bold"),
-                fill="black", anchor="nw"
-            )
-
     def _fmt_short(self, secs: int) -> str:
         h = secs // 3600
         m = (secs % 3600) // 60
@@ -610,35 +731,44 @@ class StopwatchApp:
 
     # -------------------- Clock --------------------
     def _current_time_text(self):
-        if self.running and self.start_time is not None:
-            elapsed = time.time() - self.start_time
-        else:
-            elapsed = 0.0
-        mins, secs = divmod(elapsed, 60)
-        hrs, mins = divmod(mins, 60)
-        cs = int((elapsed - int(elapsed)) * 100)
-        return f"{int(hrs):02}:{int(mins):02}:{int(secs):02}.{cs:02}"
-
-    def _update_clock(self):
-        # Safety net for day change between autosaves
-        now_dt = datetime.now()
-        if self.running:
-            if now_dt.date() != self._last_autosave_dt.date():
+        if not self.running or self.start_monotonic is None:
+            return "00:00:00.00"
+        # all integer math on elapsed centiseconds
+        t = int((time.monotonic() - self.start_monotonic) * 100)
+        cs = t % 100
+        s = (t // 100) % 60
+        m = (t // 6000) % 60
+        h = t // 360000
+        return f"{h:02d}:{m:02d}:{s:02d}.{cs:02d}"
+
+    def _tick_label(self):
+        """Fast loop: only updates the main window clock label."""
+        # Safety net for day change between autosaves (datetime only every 30 s)
+        now = time.time()
+        if self.running and now - self._last_day_check_sec >= self._day_check_interval_sec:
+            self._last_day_check_sec = now
+            if datetime.fromtimestamp(now).date() != self._last_autosave_dt.date():
                 self._do_autosave()  # handles rollover + update
-        text = self._current_time_text()
-        self.clock_label.config(text=text)
-        self._render_overlay_text(text)
-        self.root.after(10, self._update_clock)
+        self.clock_label.config(text=self._current_time_text())
+        self.root.after(self._clock_interval_ms, self._tick_label)
+
+    def _tick_overlay(self):
+        """Slow loop: redraws the overlay (time + cached daily totals line).
+           A hidden overlay is destroyed, so _render_overlay_text returns early on its own.
+        """
+        self._render_overlay_text(self._current_time_text())
+        self.root.after(self._overlay_interval_ms, self._tick_overlay)
 
     # -------------------- Dashboard --------------------
     def open_settings(self):
-        rows = self.cur.execute("""
-            SELECT a.name, s.start_ts, s.end_ts, s.duration_sec
+        # Totals are aggregated by SQLite; session rows are paged in on scroll
+        totals = dict(self.cur.execute("""
+            SELECT a.name, SUM(s.duration_sec)
             FROM sessions s
             JOIN activities a ON s.activity_id = a.id
-            ORDER BY s.start_ts DESC;
-        """).fetchall()
-
+            GROUP BY a.id
+            ORDER BY a.name;
+        """).fetchall())
         dashboard = Toplevel(self.root)
         dashboard.title("Activity Dashboard")
         dashboard.geometry("780x540")
@@ -650,21 +780,54 @@ class StopwatchApp:
             tree.column(col, width=190 if col != "Duration (sec)" else 130, stretch=True)
         tree.pack(fill=tk.BOTH, expand=True)
 
-        totals = defaultdict(float)
-        for name, start_ts, end_ts, dur in rows:
-            tree.insert("", tk.END, values=(name, start_ts, end_ts, dur))
-            totals[name] += float(dur or 0)
+        # Keyset paging: continue strictly after the last (start_ts, id) loaded, so rows
+        # inserted while the dashboard is open can't shift pages and duplicate entries
+        page = {"last": None, "done": False, "loading": False}
+
+        def load_next_page():
+            page["loading"] = True
+            if page["last"] is None:
+                rows = self.cur.execute("""
+                    SELECT s.id, a.name, s.start_ts, s.end_ts, s.duration_sec
+                    FROM sessions s
+                    JOIN activities a ON s.activity_id = a.id
+                    ORDER BY s.start_ts DESC, s.id DESC
+                    LIMIT ?;
+                """, (DASHBOARD_PAGE_SIZE,)).fetchall()
+            else:
+                rows = self.cur.execute("""
+                    SELECT s.id, a.name, s.start_ts, s.end_ts, s.duration_sec
+                    FROM sessions s
+                    JOIN activities a ON s.activity_id = a.id
+                    WHERE (s.start_ts, s.id) < (?, ?)
+                    ORDER BY s.start_ts DESC, s.id DESC
+                    LIMIT ?;
+                """, (*page["last"], DASHBOARD_PAGE_SIZE)).fetchall()
+            for _id, name, start_ts, end_ts, dur in rows:
+                tree.insert("", tk.END, values=(name, start_ts, end_ts, dur))
+            if rows:
+                page["last"] = (rows[-1][2], rows[-1][0])
+            page["done"] = len(rows) < DASHBOARD_PAGE_SIZE
+            page["loading"] = False
+
+        def on_yscroll(first, last):
+            # Near the bottom of what is loaded -> fetch the next page
+            if not page["done"] and not page["loading"] and float(last) > 0.9:
+                load_next_page()
+
+        tree.configure(yscrollcommand=on_yscroll)
+        load_next_page()
 
         summary_frame = tk.Frame(dashboard)
         summary_frame.pack(fill=tk.X, pady=6)
 
         if HAS_MPL and totals:
-            summary_lines = [f"{name}: {round(sec/60, 2)} min" for name, sec in sorted(totals.items())]
+            summary_lines = [f"{name}: {round(sec/60, 2)} min" for name, sec in totals.items()]
             tk.Label(summary_frame,
                      text="Total Time per Activity (all-time):\n" + "\n".join(summary_lines),
                      justify="left").pack(side=tk.LEFT, padx=10)
 
-            fig, ax = plt.subplots(figsize=(4.8, 3.2))
+            fig, ax = plt.subplots(figsize=(4.8, 3.2), dpi=72)
             activities = list(totals.keys())
             durations_min = [sec/60 for sec in totals.values()]
             ax.bar(activities, durations_min)
@@ -674,8 +837,10 @@ class StopwatchApp:
             plt.xticks(rotation=45, ha="right")
 
             canvas = FigureCanvasTkAgg(fig, master=summary_frame)
-            canvas.draw()
+            canvas.draw_idle()  # render once Tk is idle, coalescing any repeat requests
             canvas.get_tk_widget().pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
+            # pyplot keeps every figure alive until closed; <Destroy> also fires for each child
+            dashboard.bind("<Destroy>", lambda e: plt.close(fig) if e.widget is dashboard else None)
         else:
             tk.Label(summary_frame, text="No sessions logged yet.").pack(pady=8)
             if not HAS_MPL:
@@ -707,16 +872,13 @@ class StopwatchApp:
         self._hotkey_thread_id = kernel32.GetCurrentThreadId()
         self._register_hotkeys()
 
+        # No window owns this thread, so there is nothing to Translate/Dispatch to;
+        # only WM_HOTKEY matters. GetMessageW returns 0 on WM_QUIT, -1 on error.
         msg = wintypes.MSG()
-        while True:
-            ret = user32.GetMessageW(ctypes.byref(msg), None, 0, 0)
-            if ret == 0 or ret == -1:  # WM_QUIT or error
-                break
+        pmsg = ctypes.byref(msg)
+        while user32.GetMessageW(pmsg, None, 0, 0) > 0:
             if msg.message == WM_HOTKEY:
-                hk_id = msg.wParam
-                self.root.after(0, self._on_hotkey, hk_id)
-            user32.TranslateMessage(ctypes.byref(msg))
-            user32.DispatchMessageW(ctypes.byref(msg))
+                self.root.after(0, self._on_hotkey, msg.wParam)
 
         self._unregister_hotkeys()
 
@@ -744,11 +906,17 @@ class StopwatchApp:
         # final autosave & finalize session
         self._do_autosave()
         self._save_previous_activity_if_running()
+        # Queued daily totals must not be dropped silently: a failure here propagates
+        # (Tk reports it), while the window still closes.
         try:
-            self.conn.close()
-        except Exception:
-            pass
-        self.root.destroy()
+            self._flush_daily_totals()
+            self.conn.commit()
+        finally:
+            try:
+                self.conn.close()
+            except Exception:
+                pass
+            self.root.destroy()
 
 
 if __name__ == "__main__":